@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import numpy as np
 import properties
 
@@ -17,6 +19,36 @@ from empymod.utils import check_hankel
 from ..utils import static_utils
 
 
+def _load_hankel_filter(hankel_filter, hankel_pts_per_dec):
+    """
+    Load the digital filter for the Hankel transform.
+    """
+    try:
+        ht, htarg = check_hankel("fht", [hankel_filter, hankel_pts_per_dec], 1)
+        return htarg[0], htarg[1]
+    except ValueError:
+        arg = {}
+        arg["dlf"] = hankel_filter
+        if hankel_pts_per_dec is not None:
+            arg["pts_per_dec"] = hankel_pts_per_dec
+        ht, htarg = check_hankel("dlf", arg, 1)
+        return htarg["dlf"], htarg["pts_per_dec"]
+
+
+_load_named_hankel_filter = lru_cache(maxsize=16)(_load_hankel_filter)
+
+
+def _get_hankel_filter(hankel_filter, hankel_pts_per_dec):
+    """
+    Get the digital filter for the Hankel transform. Filters given by name
+    are cached and shared by all the simulations using them, filter objects
+    supplied by the user are used as is.
+    """
+    if isinstance(hankel_filter, str):
+        return _load_named_hankel_filter(hankel_filter, hankel_pts_per_dec)
+    return _load_hankel_filter(hankel_filter, hankel_pts_per_dec)
+
+
 class Simulation1DLayers(BaseSimulation):
     """
     1D DC Simulation
@@ -45,20 +77,10 @@ class Simulation1DLayers(BaseSimulation):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        try:
-            ht, htarg = check_hankel(
-                "fht", [self.hankel_filter, self.hankel_pts_per_dec], 1
-            )
-            self.fhtfilt = htarg[0]  # Store filter
-            self.hankel_pts_per_dec = htarg[1]  # Store pts_per_dec
-        except ValueError:
-            arg = {}
-            arg["dlf"] = self.hankel_filter
-            if self.hankel_pts_per_dec is not None:
-                arg["pts_per_dec"] = self.hankel_pts_per_dec
-            ht, htarg = check_hankel("dlf", arg, 1)
-            self.fhtfilt = htarg["dlf"]  # Store filter
-            self.hankel_pts_per_dec = htarg["pts_per_dec"]  # Store pts_per_dec
+        # Store filter and pts_per_dec
+        self.fhtfilt, self.hankel_pts_per_dec = _get_hankel_filter(
+            self.hankel_filter, self.hankel_pts_per_dec
+        )
         self.hankel_filter = self.fhtfilt.name  # Store name
         self.n_filter = self.fhtfilt.base.size
 
@@ -71,14 +93,13 @@ class Simulation1DLayers(BaseSimulation):
             print(">> Compute fields")
 
         # TODO: this for loop can slow down the speed, cythonize below for loop
-        T1 = self.rho[self.n_layer - 1] * np.ones_like(self.lambd)
+        lambd = self.lambd
+        T0 = np.full_like(lambd, self.rho[self.n_layer - 1])
         for ii in range(self.n_layer - 1, 0, -1):
             rho0 = self.rho[ii - 1]
-            t0 = self.thicknesses[ii - 1]
-            T0 = (T1 + rho0 * np.tanh(self.lambd * t0)) / (
-                1.0 + (T1 * np.tanh(self.lambd * t0) / rho0)
-            )
-            T1 = T0
+            # evaluate tanh once per layer, it is used twice in the recursion
+            tanh = np.tanh(lambd * self.thicknesses[ii - 1])
+            T0 = (T0 + rho0 * tanh) / (1.0 + T0 * tanh / rho0)
         PJ = (T0, None, None)
         try:
             voltage = (
@@ -225,8 +246,9 @@ class Simulation1DLayers(BaseSimulation):
         """
         # TODO: only works isotropic sigma
         if getattr(self, "_lambd", None) is None:
+            # the DC kernel is real, no need to store it as complex
             self._lambd = np.empty(
-                [self.offset.size, self.n_filter], order="F", dtype=complex
+                [self.offset.size, self.n_filter], order="F", dtype=float
             )
             self.lambd[:, :], _ = get_dlf_points(
                 self.fhtfilt, self.offset, self.hankel_pts_per_dec
@@ -1,7 +1,16 @@
+from functools import lru_cache
+
 from ...survey import BaseSrc
 from .analytics import IDTtoxyz
 
 
+@lru_cache(maxsize=128)
+def _inducing_field_b0(amplitude, inclination, declination):
+    b0 = IDTtoxyz(-inclination, declination, amplitude)
+    b0.flags.writeable = False
+    return b0
+
+
 class SourceField(BaseSrc):
     """Define the inducing field"""
 
@@ -11,7 +20,12 @@ class SourceField(BaseSrc):
         ), "Inducing field 'parameters' must be a list or tuple of length 3 (amplitude, inclination, declination"
 
         self.parameters = parameters
-        self.b0 = IDTtoxyz(-parameters[1], parameters[2], parameters[0])
+        try:
+            # copy so the cached inducing field is never modified in place
+            self.b0 = _inducing_field_b0(*parameters).copy()
+        except TypeError:
+            # unhashable (e.g. array valued) parameters can't be cached
+            self.b0 = IDTtoxyz(-parameters[1], parameters[2], parameters[0])
         super(SourceField, self).__init__(
             receiver_list=receiver_list, parameters=parameters, **kwargs
         )
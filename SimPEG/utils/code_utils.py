@@ -1,5 +1,7 @@
 from __future__ import print_function, division
+import os
 import types
+import weakref
 import numpy as np
 from functools import wraps
 import warnings
@@ -54,24 +56,48 @@ def memProfileWrapper(towrap, *funNames):
     return type(towrap.__name__ + "MemProfileWrap", (towrap,), attrs)
 
 
-def hook(obj, method, name=None, overwrite=False, silent=False):
+def hook(obj, method, name=None, overwrite=False, silent=False, class_wide=False):
     """
     This dynamically binds a method to the instance of the class.
 
-    If name is None, the name of the method is used.
+    If name is None, the name of the method is used. If class_wide is True,
+    the method is instead added to the class of obj, so it is shared by all
+    (current and future) instances of that class without storing a bound
+    method on each of them.
     """
     if name is None:
         name = method.__name__
         if name == "<lambda>":
             raise Exception("Must provide name to hook lambda functions.")
     if not hasattr(obj, name) or overwrite:
-        setattr(obj, name, types.MethodType(method, obj))
+        if class_wide:
+            setattr(type(obj), name, method)
+            # the class attributes changed, forget what was found on them
+            _hook_names_cache.clear()
+            _attribute_names_cache.clear()
+        else:
+            setattr(obj, name, types.MethodType(method, obj))
         if getattr(obj, "debug", False):
             print("Method " + name + " was added to class.")
     elif not silent or getattr(obj, "debug", False):
         print("Method " + name + " was not overwritten.")
 
 
+# cache of the attribute names defined on a class and its bases, {cls: names}
+_attribute_names_cache = weakref.WeakKeyDictionary()
+
+
+def _get_attribute_names(cls):
+    """
+    Return a frozenset of the attribute names defined on cls and its bases.
+    """
+    names = _attribute_names_cache.get(cls)
+    if names is None:
+        names = frozenset(dir(cls))
+        _attribute_names_cache[cls] = names
+    return names
+
+
 def setKwargs(obj, ignore=None, **kwargs):
     """
     Sets key word arguments (kwargs) that are present in the object,
@@ -79,10 +105,12 @@ def setKwargs(obj, ignore=None, **kwargs):
     """
     if ignore is None:
         ignore = []
+    valid = _get_attribute_names(type(obj))
+    instance_attrs = getattr(obj, "__dict__", {})
     for attr in kwargs:
         if attr in ignore:
             continue
-        if hasattr(obj, attr):
+        if attr in valid or attr in instance_attrs:
             setattr(obj, attr, kwargs[attr])
         else:
             raise Exception("{0!s} attr is not recognized".format(attr))
@@ -91,54 +119,88 @@ def setKwargs(obj, ignore=None, **kwargs):
     # hook(obj, setKwargs, silent=True)
 
 
-def printDone(obj, printers, name="Done", pad=""):
-    titles = ""
-    widths = 0
+def _compile_printers(printers):
+    """
+    Store the cell format string and the formatted title of each printer
+    on the printer, so they are not rebuilt on every iteration. They are
+    rebuilt if the width or the title of the printer changes.
+    """
     for printer in printers:
-        titles += ("{{:^{0:d}}}".format(printer["width"])).format(printer["title"]) + ""
-        widths += printer["width"]
+        key = (printer["width"], printer["title"])
+        if printer.get("_cell_key") != key:
+            printer["_cell_fmt"] = "{{:^{0:d}}}".format(printer["width"])
+            printer["_title_cell"] = printer["_cell_fmt"].format(printer["title"])
+            printer["_cell_key"] = key
+    return printers
+
+
+def printDone(obj, printers, name="Done", pad=""):
+    widths = sum(printer["width"] for printer in printers)
     print(pad + "{0} {1} {0}".format("=" * ((widths - 1 - len(name)) // 2), name))
     # print(pad + "%s" % '-'*widths)
 
 
 def printTitles(obj, printers, name="Print Titles", pad=""):
-    titles = ""
-    widths = 0
-    for printer in printers:
-        titles += ("{{:^{0:d}}}".format(printer["width"])).format(printer["title"]) + ""
-        widths += printer["width"]
+    _compile_printers(printers)
+    titles = "".join(printer["_title_cell"] for printer in printers)
+    widths = sum(printer["width"] for printer in printers)
     print(pad + "{0} {1} {0}".format("=" * ((widths - 1 - len(name)) // 2), name))
     print(pad + titles)
     print(pad + "%s" % "-" * widths)
 
 
 def printLine(obj, printers, pad=""):
-    values = ""
-    for printer in printers:
-        values += ("{{:^{0:d}}}".format(printer["width"])).format(
-            printer["format"] % printer["value"](obj)
-        )
+    _compile_printers(printers)
+    values = "".join(
+        printer["_cell_fmt"].format(printer["format"] % printer["value"](obj))
+        for printer in printers
+    )
     print(pad + values)
 
 
-def checkStoppers(obj, stoppers):
-    # check stopping rules
-    optimal = []
-    critical = []
+def _prepare_stoppers(stoppers):
+    """
+    Split the stopping rules into the left and right callables of the
+    optimal and critical rules.
+    """
+    optimal_lefts, optimal_rights = [], []
+    critical_lefts, critical_rights = [], []
     for stopper in stoppers:
-        l = stopper["left"](obj)
-        r = stopper["right"](obj)
         if stopper["stopType"] == "optimal":
-            optimal.append(l <= r)
-        if stopper["stopType"] == "critical":
-            critical.append(l <= r)
+            optimal_lefts.append(stopper["left"])
+            optimal_rights.append(stopper["right"])
+        elif stopper["stopType"] == "critical":
+            critical_lefts.append(stopper["left"])
+            critical_rights.append(stopper["right"])
+    return optimal_lefts, optimal_rights, critical_lefts, critical_rights
+
+
+def _evaluate_stoppers(obj, lefts, rights):
+    n = len(lefts)
+    l = np.fromiter((left(obj) for left in lefts), dtype=float, count=n)
+    r = np.fromiter((right(obj) for right in rights), dtype=float, count=n)
+    return np.less_equal(l, r)
+
+
+def checkStoppers(obj, stoppers):
+    # check stopping rules
+    optimal_lefts, optimal_rights, critical_lefts, critical_rights = _prepare_stoppers(
+        stoppers
+    )
+    if not optimal_lefts and not critical_lefts:
+        return False
+
+    optimal = _evaluate_stoppers(obj, optimal_lefts, optimal_rights)
+    critical = _evaluate_stoppers(obj, critical_lefts, critical_rights)
 
     if obj.debug:
         print("checkStoppers.optimal: ", optimal)
     if obj.debug:
         print("checkStoppers.critical: ", critical)
 
-    return (len(optimal) > 0 and all(optimal)) | (len(critical) > 0 and any(critical))
+    return bool(
+        (optimal.size > 0 and optimal.all()) | (critical.size > 0 and critical.any())
+    )
 
 
 def printStoppers(obj, stoppers, pad="", stop="STOP!", done="DONE!"):
@@ -150,6 +212,33 @@ def printStoppers(obj, stoppers, pad="", stop="STOP!", done="DONE!"):
     print(pad + "{0!s}{1!s}{2!s}".format("-" * 25, done, "-" * 25))
 
 
+# cache of the hook method names found on a class, {cls: {needle: names}}
+_hook_names_cache = weakref.WeakKeyDictionary()
+
+
+def _get_hook_names(obj, needle):
+    """
+    Return the names of the hook methods available on obj, i.e. the
+    attributes with needle (``"_" + match``) in their name.
+
+    The names found on the class are only looked up once per class and
+    cached. The instance dictionary is still checked on every call, for
+    backward compatibility with hooks bound to a single instance, either by
+    hook (without class_wide) or by setting the method on the instance.
+    Use hook(..., class_wide=True) to only pay for the cached class lookup.
+    """
+    cls = type(obj)
+    cls_hooks = _hook_names_cache.setdefault(cls, {})
+    names = cls_hooks.get(needle)
+    if names is None:
+        names = tuple(name for name in dir(cls) if needle in name)
+        cls_hooks[needle] = names
+    instance_names = [name for name in getattr(obj, "__dict__", ()) if needle in name]
+    if instance_names:
+        names = sorted(set(names).union(instance_names))
+    return names
+
+
 def callHooks(match, mainFirst=False):
     """
     Use this to wrap a funciton::
@@ -163,29 +252,24 @@ def callHooks(match, mainFirst=False):
     This can be reversed by adding the mainFirst=True kwarg.
     """
 
+    needle = "_" + match
+
+    def run_hooks(self, *args, **kwargs):
+        for method in _get_hook_names(self, needle):
+            if getattr(self, "debug", False):
+                print((match + " is calling self." + method))
+            getattr(self, method)(*args, **kwargs)
+
     def callHooksWrap(f):
         @wraps(f)
         def wrapper(self, *args, **kwargs):
 
             if not mainFirst:
-                for method in [
-                    posible for posible in dir(self) if ("_" + match) in posible
-                ]:
-                    if getattr(self, "debug", False):
-                        print((match + " is calling self." + method))
-                    getattr(self, method)(*args, **kwargs)
-
+                run_hooks(self, *args, **kwargs)
                 return f(self, *args, **kwargs)
             else:
                 out = f(self, *args, **kwargs)
-
-                for method in [
-                    posible for posible in dir(self) if ("_" + match) in posible
-                ]:
-                    if getattr(self, "debug", False):
-                        print((match + " is calling self." + method))
-                    getattr(self, method)(*args, **kwargs)
-
+                run_hooks(self, *args, **kwargs)
                 return out
 
         extra = """
@@ -211,13 +295,21 @@ def dependentProperty(name, value, children, doc):
         return getattr(self, name, value)
 
     def fset(self, val):
-        if (np.isscalar(val) and getattr(self, name, value) == val) or val is getattr(
-            self, name, value
-        ):
+        current = getattr(self, name, value)
+        if val is current:
             return  # it is the same!
-        for child in children:
-            if hasattr(self, child):
-                delattr(self, child)
+        # an equal value is still stored, so the attribute is val, but the
+        # children computed from the current value remain valid
+        if np.isscalar(val) and np.isscalar(current):
+            unchanged = current == val
+        elif isinstance(val, np.ndarray) and isinstance(current, np.ndarray):
+            unchanged = val.shape == current.shape and np.array_equal(val, current)
+        else:
+            unchanged = False
+        if not unchanged:
+            for child in children:
+                if hasattr(self, child):
+                    delattr(self, child)
         setattr(self, name, val)
 
     return property(fget=fget, fset=fset, doc=doc)
@@ -346,6 +438,48 @@ class Report(ScoobyReport):
         )
 
 
+def _deprecation_warner(message, future_warn=False, error=False, stacklevel=2):
+    """
+    Create the callable used by the deprecation helpers to report the use
+    of a deprecated object.
+
+    The warning category (or the error) is chosen once here, instead of on
+    every call of the deprecated object. The warning is only issued the first
+    time the deprecated object is used. Setting the
+    ``SIMPEG_FORCE_DEPRECATION_WARNINGS`` environment variable (to any
+    non-empty value) issues it on every use instead; the variable is checked
+    on each call, so it can be set at any time, e.g. from within a test.
+
+    stacklevel is relative to the function calling the returned callable,
+    the default of 2 attributes the warning to the caller of that function
+    instead of to SimPEG's internals.
+    """
+    if future_warn:
+        category = FutureWarning
+    elif error:
+
+        def raise_error():
+            raise NotImplementedError(message)
+
+        return raise_error
+    else:
+        category = DeprecationWarning
+    _warn = warnings.warn
+    _environ = os.environ
+    # skip the frame of warn itself
+    stacklevel += 1
+    warned = False
+
+    def warn():
+        nonlocal warned
+        if not warned or _environ.get("SIMPEG_FORCE_DEPRECATION_WARNINGS"):
+            _warn(message, category, stacklevel=stacklevel)
+            # only set once issued, an "error" filter raises on every call
+            warned = True
+
+    return warn
+
+
 def deprecate_class(
     removal_version=None, new_location=None, future_warn=False, error=False
 ):
@@ -359,17 +493,13 @@ def deprecate_class(
             message += f" It will be removed in version {removal_version} of SimPEG."
         else:
             message += " It will be removed in a future version of SimPEG."
+        warn = _deprecation_warner(message, future_warn, error)
 
         # stash the original initialization of the class
         cls._old__init__ = cls.__init__
 
         def __init__(self, *args, **kwargs):
-            if future_warn:
-                warnings.warn(message, FutureWarning)
-            elif error:
-                raise NotImplementedError(message)
-            else:
-                warnings.warn(message, DeprecationWarning)
+            warn()
             self._old__init__(*args, **kwargs)
 
         cls.__init__ = __init__
@@ -392,12 +522,9 @@ def deprecate_module(
     else:
         message += " It will be removed in a future version of SimPEG."
     message += " Please update your code accordingly."
-    if future_warn:
-        warnings.warn(message, FutureWarning)
-    elif error:
-        raise NotImplementedError(message)
-    else:
-        warnings.warn(message, DeprecationWarning)
+    # stacklevel=3 skips this function and the deprecated module, so the
+    # warning points at the code importing it (importlib frames are skipped)
+    _deprecation_warner(message, future_warn, error, stacklevel=3)()
 
 
 def deprecate_property(
@@ -421,23 +548,14 @@ def deprecate_property(
         message += f" It will be removed in version {removal_version} of SimPEG."
     else:
         message += " It will be removed in a future version of SimPEG."
+    warn = _deprecation_warner(message, future_warn, error)
 
     def get_dep(self):
-        if future_warn:
-            warnings.warn(message, FutureWarning)
-        elif error:
-            raise NotImplementedError(message)
-        else:
-            warnings.warn(message, DeprecationWarning)
+        warn()
         return prop.fget(self)
 
     def set_dep(self, other):
-        if future_warn:
-            warnings.warn(message, FutureWarning)
-        elif error:
-            raise NotImplementedError(message)
-        else:
-            warnings.warn(message, DeprecationWarning)
+        warn()
         prop.fset(self, other)
 
     doc = f"`{old_name}` has been deprecated. See `{new_name}` for documentation"
@@ -460,14 +578,10 @@ def deprecate_method(
         message += f" It will be removed in version {removal_version} of SimPEG."
     else:
         message += " It will be removed in a future version of SimPEG."
+    warn = _deprecation_warner(message, future_warn, error)
 
     def new_method(*args, **kwargs):
-        if future_warn:
-            warnings.warn(message, FutureWarning)
-        elif error:
-            raise NotImplementedError(message)
-        else:
-            warnings.warn(message, DeprecationWarning)
+        warn()
         return method(*args, **kwargs)
 
     doc = f"`{old_name}` has been deprecated. See `{new_name}` for documentation"
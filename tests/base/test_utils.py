@@ -4,6 +4,8 @@ import numpy as np
 import scipy.sparse as sp
 import os
 import shutil
+import warnings
+from unittest import mock
 from SimPEG.utils import (
     sdiag,
     sub2ind,
@@ -23,6 +25,16 @@ from SimPEG.utils import (
     Counter,
     download,
     surface2ind_topo,
+    callHooks,
+    hook,
+    checkStoppers,
+    dependentProperty,
+)
+from SimPEG.utils.code_utils import (
+    deprecate_class,
+    deprecate_method,
+    deprecate_module,
+    deprecate_property,
 )
 import discretize
 from discretize.tests import checkDerivative
@@ -77,6 +89,242 @@ class TestCounter(unittest.TestCase):
         self.assertTrue(True)
 
 
+class TestCallHooks(unittest.TestCase):
+    def test_hooks_called(self):
+        class MyClass(object):
+            def __init__(self):
+                self.called = []
+
+            @callHooks("doThing")
+            def doThing(self):
+                self.called.append("main")
+
+            def _doThing_a(self):
+                self.called.append("a")
+
+        c = MyClass()
+        c.doThing()
+        self.assertEqual(c.called, ["a", "main"])
+
+        # hooks added after the first call are still found
+        def _doThing_b(self):
+            self.called.append("b")
+
+        hook(c, _doThing_b)
+        c.called = []
+        c.doThing()
+        self.assertEqual(c.called, ["a", "b", "main"])
+
+    def test_hook_instance(self):
+        class MyClass(object):
+            pass
+
+        def my_method(self):
+            return "hooked"
+
+        a, b = MyClass(), MyClass()
+        hook(a, my_method)
+        self.assertEqual(a.my_method(), "hooked")
+        self.assertIs(type(a), MyClass)
+        self.assertFalse(hasattr(b, "my_method"))
+        self.assertFalse(hasattr(MyClass(), "my_method"))
+
+    def test_hook_twice(self):
+        class MyClass(object):
+            pass
+
+        def first(self):
+            return 1
+
+        def second(self):
+            return 2
+
+        a = MyClass()
+        hook(a, first)
+        hook(a, second)
+        self.assertEqual((a.first(), a.second()), (1, 2))
+        self.assertIs(type(a), MyClass)
+        self.assertFalse(hasattr(MyClass(), "first"))
+
+        # hooking an existing name needs overwrite
+        hook(a, second, name="first", silent=True)
+        self.assertEqual(a.first(), 1)
+        hook(a, second, name="first", overwrite=True)
+        self.assertEqual(a.first(), 2)
+
+    def test_hook_class_wide(self):
+        class MyClass(object):
+            pass
+
+        def my_method(self):
+            return "hooked"
+
+        a, b = MyClass(), MyClass()
+        hook(a, my_method, class_wide=True)
+        self.assertNotIn("my_method", a.__dict__)
+        self.assertEqual(b.my_method(), "hooked")
+        self.assertEqual(MyClass().my_method(), "hooked")
+
+
+class TestCheckStoppers(unittest.TestCase):
+    def setUp(self):
+        class Opt(object):
+            debug = False
+            a = 1.0
+            b = 2.0
+
+        self.opt = Opt()
+        self.true = {"left": lambda M: M.a, "right": lambda M: M.b}
+        self.false = {"left": lambda M: M.b, "right": lambda M: M.a}
+
+    def stopper(self, rule, stopType):
+        return dict(rule, stopType=stopType)
+
+    def test_empty(self):
+        self.assertFalse(checkStoppers(self.opt, []))
+
+    def test_optimal_all(self):
+        stoppers = [
+            self.stopper(self.true, "optimal"),
+            self.stopper(self.true, "optimal"),
+        ]
+        self.assertTrue(checkStoppers(self.opt, stoppers))
+        stoppers.append(self.stopper(self.false, "optimal"))
+        self.assertFalse(checkStoppers(self.opt, stoppers))
+
+    def test_critical_any(self):
+        stoppers = [
+            self.stopper(self.false, "critical"),
+            self.stopper(self.false, "optimal"),
+        ]
+        self.assertFalse(checkStoppers(self.opt, stoppers))
+        stoppers.append(self.stopper(self.true, "critical"))
+        self.assertTrue(checkStoppers(self.opt, stoppers))
+
+
+class TestDeprecationWarnings(unittest.TestCase):
+    def deprecated(self, **kwargs):
+        def new_function():
+            return 1
+
+        return deprecate_method(new_function, "old_function", **kwargs)
+
+    def test_category(self):
+        for kwargs, category in [
+            ({}, DeprecationWarning),
+            ({"future_warn": True}, FutureWarning),
+        ]:
+            old_function = self.deprecated(**kwargs)
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter("always")
+                old_function()
+            self.assertEqual(len(w), 1)
+            self.assertIs(w[0].category, category)
+
+    def test_error(self):
+        old_function = self.deprecated(error=True)
+        for _ in range(2):
+            with self.assertRaises(NotImplementedError):
+                old_function()
+
+    def test_warning_location(self):
+        class New(object):
+            def __init__(self):
+                self._x = 1
+
+            @property
+            def x(self):
+                return self._x
+
+            old_x = deprecate_property(x, "old_x")
+
+        @deprecate_class()
+        class Old(New):
+            pass
+
+        old_function = self.deprecated()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            old_function()
+            obj = Old()
+            obj.old_x
+        self.assertEqual(len(w), 3)
+        for warning in w:
+            # the warnings point at this test, not at SimPEG's internals
+            self.assertEqual(warning.filename, __file__)
+
+    def test_module_warning_location(self):
+        def deprecated_module():
+            # stands in for the top level of a deprecated module
+            deprecate_module("old_module", "new_module")
+
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            deprecated_module()
+        self.assertEqual(len(w), 1)
+        self.assertIs(w[0].category, DeprecationWarning)
+        self.assertEqual(w[0].filename, __file__)
+
+        def removed_module():
+            deprecate_module("old_module", "new_module", error=True)
+
+        with self.assertRaises(NotImplementedError):
+            removed_module()
+
+    def test_warn_once(self):
+        old_function = self.deprecated()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            self.assertEqual(old_function(), 1)
+            self.assertEqual(old_function(), 1)
+        self.assertEqual(len(w), 1)
+
+    def test_error_filter(self):
+        old_function = self.deprecated()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for _ in range(2):
+                with self.assertRaises(DeprecationWarning):
+                    old_function()
+
+    def test_force_warnings(self):
+        old_function = self.deprecated()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            old_function()
+            with mock.patch.dict(
+                os.environ, {"SIMPEG_FORCE_DEPRECATION_WARNINGS": "1"}
+            ):
+                old_function()
+                old_function()
+            old_function()
+        self.assertEqual(len(w), 3)
+
+
+class TestDependentProperty(unittest.TestCase):
+    def setUp(self):
+        class MyClass(object):
+            x = dependentProperty("_x", None, ["_child"], "x")
+
+        self.obj = MyClass()
+        self.obj.x = np.r_[1.0, 2.0, 3.0]
+        self.obj._child = "computed from x"
+
+    def test_equal_array(self):
+        new_x = np.r_[1.0, 2.0, 3.0]
+        self.obj.x = new_x
+        self.assertIs(self.obj.x, new_x)
+        self.assertTrue(hasattr(self.obj, "_child"))
+
+    def test_changed_array(self):
+        self.obj.x = np.r_[1.0, 2.0, 4.0]
+        self.assertFalse(hasattr(self.obj, "_child"))
+
+    def test_changed_shape(self):
+        self.obj.x = np.r_[1.0, 2.0]
+        self.assertFalse(hasattr(self.obj, "_child"))
+
+
 class TestSequenceFunctions(unittest.TestCase):
     def setUp(self):
         self.a = np.array([1, 2, 3])
@@ -0,0 +1,31 @@
+import unittest
+import numpy as np
+
+from SimPEG.potential_fields import magnetics as mag
+
+
+class TestSourceField(unittest.TestCase):
+    def test_b0(self):
+        parameters = (50000.0, 60.0, 30.0)
+        src = mag.sources.SourceField(parameters=parameters)
+        np.testing.assert_allclose(src.b0, mag.analytics.IDTtoxyz(-60.0, 30.0, 50000.0))
+
+    def test_b0_not_shared(self):
+        parameters = (50000.0, 60.0, 30.0)
+        src1 = mag.sources.SourceField(parameters=parameters)
+        src2 = mag.sources.SourceField(parameters=parameters)
+        b0 = src2.b0.copy()
+        src1.b0[0] = 0.0
+        np.testing.assert_array_equal(src2.b0, b0)
+        np.testing.assert_array_equal(
+            mag.sources.SourceField(parameters=parameters).b0, b0
+        )
+
+    def test_unhashable_parameters(self):
+        parameters = [np.r_[50000.0], np.r_[60.0], np.r_[30.0]]
+        src = mag.sources.SourceField(parameters=parameters)
+        np.testing.assert_allclose(src.b0, mag.analytics.IDTtoxyz(-60.0, 30.0, 50000.0))
+
+
+if __name__ == "__main__":
+    unittest.main()